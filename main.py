@@ -1,14 +1,20 @@
 import os
 import time
 import json
+import queue
+import asyncio
+import functools
 import random
 import csv
 import re
+import atexit
 import logging
+from collections import ChainMap
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse, urljoin
-from concurrent.futures import ProcessPoolExecutor, as_completed
-from multiprocessing import Manager, Lock
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from threading import Event, Lock, Thread
 
 import argparse
 from selenium import webdriver
@@ -17,20 +23,313 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from webdriver_manager.chrome import ChromeDriverManager
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('scraper.log'),
-        logging.StreamHandler()
-    ]
-)
+# ClientConfig (Selenium 4.23+) lets us size the urllib3 pool used for
+# chromedriver commands; older versions fall back to the default pool
+try:
+    from selenium.webdriver.remote.client_config import ClientConfig
+except ImportError:
+    ClientConfig = None
+
+# Optional HTTP fast path: fetching listing HTML directly and parsing it
+# with a C-backed parser is orders of magnitude cheaper than driving a
+# browser. Only usable when the listing renders without JavaScript, so it
+# is opt-in (useHttpFetch config key) and falls back to Selenium for any
+# page that yields no result items.
+try:
+    import aiohttp
+    from selectolax.parser import HTMLParser
+    HTTP_FETCH_AVAILABLE = True
+except ImportError:
+    HTTP_FETCH_AVAILABLE = False
+
+# Optional bloom filter used as a cheap pre-filter for very large target
+# lists; pointless below a few thousand entries, where the frozenset wins
+try:
+    from pybloom_live import ScalableBloomFilter
+except ImportError:
+    ScalableBloomFilter = None
+
+# Optional orjson for JSON parsing (2-5x faster than stdlib on large
+# target lists); the stdlib module is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _load_json(data):
+    """Parse JSON from bytes/str with orjson when available
+
+    Raises ValueError (the common base of both decoders' errors) on
+    malformed input.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Minimum number of target URLs before a bloom pre-filter pays for itself
+BLOOM_FILTER_THRESHOLD = 5000
+
+# Everything the scraper produces (CSVs, screenshots, page sources,
+# downloads) lands here; created once at import instead of per call
+OUTPUT_DIR = 'output'
+os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+# How many streamed results the writer thread buffers before a writerows
+# flush; small enough that the on-disk CSV stays close to live
+_STREAM_BATCH_SIZE = 50
+
+# Configure logging. Records are routed through a queue so worker threads
+# never block on file/stream I/O; a single listener thread owns the
+# handlers and does the actual formatting and writing.
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_file_handler = logging.FileHandler('scraper.log')
+_log_file_handler.setFormatter(_log_formatter)
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(_log_formatter)
+
+_log_queue = queue.Queue()
+_log_listener = QueueListener(_log_queue, _log_file_handler, _log_stream_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# Attach the queue handler directly: basicConfig would give it a default
+# formatter, which QueueHandler bakes into the record before the
+# listener's handlers format it again
+_root_logger = logging.getLogger()
+_root_logger.setLevel(logging.INFO)
+_root_logger.addHandler(QueueHandler(_log_queue))
 logger = logging.getLogger('FWCScraper')
 
+# Precompiled patterns for the per-item/per-chip extraction hot path.
+# Note: the old inline onclick patterns used [\\s]* and \\) inside raw
+# strings, which match a literal backslash and never matched real onclick
+# attributes - downloadDocument/applyTagAsFilter parsing silently failed.
+_RE_FWCA = re.compile(r'\[\d{4}\]\s*FWCA\s*\d+')
+_RE_DATE = re.compile(r'\d{1,2}\s+[A-Za-z]+\s+\d{4}')
+_RE_AE = re.compile(r'AE\d+')
+_RE_DOWNLOAD = re.compile(r"downloadDocument\(['\"](\d+)['\"]\s*,\s*['\"](.*?)['\"]\)")
+_RE_FILTER = re.compile(r"applyTagAsFilter\(['\"](.*?)['\"]\s*,\s*['\"](.*?)['\"]\)")
+# Anchored to the parameter boundary so keys like perpage= don't match
+_RE_PAGE_NUM = re.compile(r'([?&])page=\d+')
+
+# Chip classification lookups - frozensets give O(1) membership instead of
+# rebuilding a list and scanning it for every chip
+_AGREEMENT_TYPES = frozenset({'Single-enterprise Agreement', 'Multi-enterprise Agreement', 'Greenfields Agreement'})
+_STATUS_VALUES = frozenset({'Approved', 'Current', 'Terminated', 'Superseded'})
+_INDUSTRY_KEYWORDS = ('industry', 'Building', 'Construction', 'Metal', 'Health', 'Education', 'Mining', 'services')
+
+# Single-pass industry keyword scan: Aho-Corasick when available, otherwise
+# one compiled alternation - either way each chip text is scanned once
+# instead of once per keyword
+try:
+    import ahocorasick
+
+    _industry_automaton = ahocorasick.Automaton()
+    for _keyword in _INDUSTRY_KEYWORDS:
+        _industry_automaton.add_word(_keyword, _keyword)
+    _industry_automaton.make_automaton()
+
+    def _has_industry_keyword(text):
+        return next(_industry_automaton.iter(text), None) is not None
+except ImportError:
+    _RE_INDUSTRY = re.compile('|'.join(map(re.escape, _INDUSTRY_KEYWORDS)))
+
+    def _has_industry_keyword(text):
+        return _RE_INDUSTRY.search(text) is not None
+
+def _parse_result_items(html):
+    """Parse .fwc-results-item nodes out of raw listing HTML
+
+    Produces the same dict shape as snapshot_result_items so
+    extract_agreements can consume either source unchanged.
+    """
+    tree = HTMLParser(html)
+    items = []
+    for node in tree.css('.fwc-results-item'):
+        pdf_href = None
+        pdf_img = node.css_first('a[href^="/document-search/view/"] img[alt="PDF"]')
+        if pdf_img is not None and pdf_img.parent is not None:
+            pdf_href = pdf_img.parent.attributes.get('href')
+
+        button = node.css_first('.fwc-button')
+        h3 = node.css_first('h3')
+        items.append({
+            'pdfHref': pdf_href,
+            'downloadOnclick': button.attributes.get('onclick') if button is not None else None,
+            'title': h3.text(strip=True) if h3 is not None else None,
+            'chips': [
+                {'text': chip.text(strip=True), 'onclick': chip.attributes.get('onclick') or ''}
+                for chip in node.css('.fwc-chip')
+            ]
+        })
+    return items
+
+
+def fetch_pages_http(urls):
+    """Fetch and parse a batch of listing pages over plain HTTP
+
+    Returns a dict mapping each URL to its parsed result items. Pages that
+    fail or contain no result items map to an empty list so callers can
+    fall back to the Selenium path for just those pages.
+    """
+    async def _fetch_all():
+        connector = aiohttp.TCPConnector(limit=20)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            async def _fetch_one(url):
+                try:
+                    async with session.get(url) as response:
+                        response.raise_for_status()
+                        return _parse_result_items(await response.text())
+                except Exception as e:
+                    logger.warning("HTTP fetch failed for %s: %s", url, e)
+                    return []
+
+            pages = await asyncio.gather(*(_fetch_one(url) for url in urls))
+            return dict(zip(urls, pages))
+
+    return asyncio.run(_fetch_all())
+
+
+# CSV export schema: result-dict keys paired with their column headers,
+# resolved once instead of per row in the exporters
+EXPORT_FIELDS = (
+    ('agreementTitle', 'Title'),
+    ('approvalDate', 'Approval Date'),
+    ('nominalExpiry', 'Expiry Date'),
+    ('status', 'Agreement status'),
+    ('agreementType', 'Agreement Type'),
+    ('agreementCode', 'Agreement reference code'),
+    ('industry', 'Industry'),
+    ('fwcaCode', 'Citation(FWCA Code)'),
+    ('downloadUrl', 'Download URL'),
+    ('pageNumber', 'Page Number'),
+    ('workerID', 'Worker ID')  # Which worker found the item, for debugging
+)
+EXPORT_KEYS = tuple(key for key, _ in EXPORT_FIELDS)
+EXPORT_HEADERS = [header for _, header in EXPORT_FIELDS]
+
+
+def _write_csv(results, output_file, log_prefix=''):
+    """Write agreement results to a CSV file in the export schema order
+
+    Shared by the single-scraper and multi-worker export paths so the
+    column layout and batching behaviour can't drift apart. Returns the
+    written file path, or None if the write failed.
+    """
+    prefix = f"{log_prefix}: " if log_prefix else ''
+    try:
+        # One writerows call over a generator of fixed-order rows; the
+        # large buffer coalesces row writes into few syscalls
+        with open(output_file, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(EXPORT_HEADERS)
+            writer.writerows(
+                [result.get(key, '') for key in EXPORT_KEYS]
+                for result in results
+            )
+
+        logger.info(f"{prefix}Exported {len(results)} records to {output_file}")
+        return output_file
+    except Exception as e:
+        logger.error(f"{prefix}Error exporting results to CSV: {e}", exc_info=True)
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _clean_url(url):
+    """Strip query parameters like '?sid=&q=' from a URL
+
+    Cached because the inputs form a small closed set: a page yields at most
+    ~20 hrefs and the target URLs are fixed, so repeat calls are free.
+    """
+    # partition scans the string once and allocates no list
+    return url.partition('?')[0] if url else url
+
+
+# Resolved chromedriver path, cached per process so only the first driver
+# construction pays the webdriver-manager update check.
+_driver_path = None
+
+
+def get_driver_path():
+    """Resolve (and cache) the chromedriver binary path for this process"""
+    global _driver_path
+    if _driver_path is None:
+        _driver_path = ChromeDriverManager().install()
+    return _driver_path
+
+
+class DriverPool:
+    """Process-wide pool of reusable Chrome WebDriver instances.
+
+    Starting Chrome costs seconds per worker and dominates wall time when
+    each worker only processes a handful of pages. Instead of quitting the
+    driver after each page range, workers release it back to the pool so
+    subsequent runs (e.g. retries) reuse the warm browser.
+    """
+
+    _pool = queue.Queue()
+
+    @classmethod
+    def acquire(cls, chrome_options):
+        """Get a pooled driver, or start a new one with the given options"""
+        try:
+            driver = cls._pool.get_nowait()
+            logger.debug("DriverPool: Reusing pooled driver")
+            return driver
+        except queue.Empty:
+            return cls._new_driver(chrome_options)
+
+    @staticmethod
+    def _new_driver(chrome_options):
+        """Start a new Chrome WebDriver
+
+        Every WebDriver command is an HTTP request to chromedriver, and
+        urllib3's default single-connection pool serializes them and drops
+        keepalive connections. Size the pool up when the running Selenium
+        supports ClientConfig.
+        """
+        service = Service(get_driver_path())
+        if ClientConfig is not None:
+            try:
+                client_config = ClientConfig(
+                    remote_server_addr=service.service_url,
+                    init_args_for_pool_manager={"maxsize": 20}
+                )
+                return webdriver.Chrome(service=service, options=chrome_options,
+                                        client_config=client_config)
+            except TypeError:
+                # Selenium version without client_config on local drivers
+                pass
+        return webdriver.Chrome(service=service, options=chrome_options)
+
+    @classmethod
+    def release(cls, driver):
+        """Reset a driver to a clean state and return it to the pool"""
+        try:
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+        except Exception as e:
+            # Driver is in a bad state; don't pool it
+            logger.debug("DriverPool: Discarding broken driver: %s", e)
+            driver.quit()
+            return
+        cls._pool.put(driver)
+
+    @classmethod
+    def shutdown(cls):
+        """Quit all pooled drivers"""
+        while True:
+            try:
+                cls._pool.get_nowait().quit()
+            except queue.Empty:
+                break
+
+
 class FWCTargetedScraper:
     def __init__(self, config, worker_id=0, shared_data=None):
         """
@@ -50,29 +349,46 @@ class FWCTargetedScraper:
         self.agreement_type = config.get('agreementType', None)
         self.status = config.get('status', None)
         self.download_documents = config.get('downloadDocuments', False)
+        self.use_http_fetch = config.get('useHttpFetch', False) and HTTP_FETCH_AVAILABLE
+        # Per-page screenshots and page-source dumps are debug artifacts;
+        # each one costs a PNG encode / page serialize plus a disk write
+        self.debug = config.get('debug', False)
         self.target_urls = config.get('targetUrls', [])
+        # Frozen set of cleaned URLs for O(1) membership checks with no
+        # manager IPC; cleaned once here so is_target_url compares like
+        # with like
+        self.target_urls_set = frozenset(map(_clean_url, self.target_urls))
+        # For bulk scrapes with tens of thousands of targets, a bloom
+        # filter rejects most non-target URLs before the frozenset lookup
+        self.target_bloom = None
+        if ScalableBloomFilter is not None and len(self.target_urls_set) >= BLOOM_FILTER_THRESHOLD:
+            self.target_bloom = ScalableBloomFilter(
+                initial_capacity=len(self.target_urls_set), error_rate=1e-4)
+            for target_url in self.target_urls_set:
+                self.target_bloom.add(target_url)
         self.base_url = "https://tribunalsearch.fwc.gov.au"
         
         # Log target page information
         if self.target_page > 1:
             logger.info(f"{self.log_prefix}: Starting from target page {self.target_page}")
         
-        # Use shared data if provided, otherwise create local ones
-        if shared_data:
-            self.processed_targets = shared_data['processed_targets']
-            self.visited_pages = shared_data['visited_pages']
-            self.results = shared_data['results']
-            self.lock = shared_data['lock']
-        else:
-            # For single-worker mode
-            self.processed_targets = []
-            self.visited_pages = []
-            self.results = []
-            self.lock = Lock()
-        
-        # Create output directory
-        self.output_dir = 'output'
-        os.makedirs(self.output_dir, exist_ok=True)
+        # Workers are shared-nothing: each keeps local bookkeeping (dicts
+        # used as sets for O(1) membership) and emits results on a queue for
+        # the parent to merge. Workers process disjoint page ranges, so no
+        # cross-worker visited/processed state is needed for correctness.
+        self.results_queue = shared_data.get('results_queue') if shared_data else None
+        # Set once every target URL has been found, so in-flight workers
+        # can abort before paying for another page load
+        self.done_event = shared_data.get('done_event') if shared_data else None
+        self.processed_targets = {}
+        self.results = []
+        self.lock = Lock()
+        # URL whose navigation was already kicked off while extracting the
+        # previous page, so process_page can skip the blocking driver.get
+        self._prefetched_url = None
+        
+        # Output directory is created once at import
+        self.output_dir = OUTPUT_DIR
         
         # Create downloads directory if needed
         if self.download_documents:
@@ -91,6 +407,11 @@ class FWCTargetedScraper:
         # Run headless for workers
         chrome_options.add_argument('--headless')
         
+        # Return from driver.get() at DOMContentLoaded instead of waiting
+        # for the full load event; the results wait on .fwc-results-item
+        # covers late-rendered content
+        chrome_options.page_load_strategy = 'eager'
+
         chrome_options.add_argument('--window-size=1920,1080')
         chrome_options.add_argument('--no-sandbox')
         chrome_options.add_argument('--disable-dev-shm-usage')
@@ -99,19 +420,35 @@ class FWCTargetedScraper:
         # Set unique user agent with worker ID to avoid detection
         chrome_options.add_argument(f'--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36 FWCWorker/{self.worker_id}')
         
+        # Disable image loading; extract_agreements only reads DOM text/attributes
+        prefs = {
+            "profile.managed_default_content_settings.images": 2
+        }
+
         # Set download directory if downloading documents
         if self.download_documents:
-            prefs = {
+            prefs.update({
                 "download.default_directory": os.path.abspath(os.path.join(self.output_dir, "downloads", f"worker_{self.worker_id}")),
                 "download.prompt_for_download": False,
                 "download.directory_upgrade": True,
                 "plugins.always_open_pdf_externally": True
-            }
-            chrome_options.add_experimental_option("prefs", prefs)
+            })
+        chrome_options.add_experimental_option("prefs", prefs)
         
-        # Initialize WebDriver
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        # Acquire a WebDriver from the pool (starts one if none are available)
+        self.driver = DriverPool.acquire(chrome_options)
+
+        # Block images, stylesheets, fonts and trackers at the network layer.
+        # The search page is JS-rendered so HTML/JS stay enabled, but asset
+        # downloads dominate driver.get() time and none of them are read.
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self.driver.execute_cdp_cmd("Network.setBlockedURLs", {
+            "urls": [
+                "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg",
+                "*.woff*", "*.css",
+                "*/analytics*", "*gtm*"
+            ]
+        })
         
     def wait_for_element(self, selector, timeout=30, by=By.CSS_SELECTOR):
         """Wait for an element to appear on the page"""
@@ -121,7 +458,7 @@ class FWCTargetedScraper:
             )
             return element
         except TimeoutException:
-            logger.warning(f"{self.log_prefix}: Timeout waiting for element: {selector}")
+            logger.warning("%s: Timeout waiting for element: %s", self.log_prefix, selector)
             return None
     
     def wait_for_elements(self, selector, timeout=30, by=By.CSS_SELECTOR):
@@ -132,7 +469,7 @@ class FWCTargetedScraper:
             )
             return elements
         except TimeoutException:
-            logger.warning(f"{self.log_prefix}: Timeout waiting for elements: {selector}")
+            logger.warning("%s: Timeout waiting for elements: %s", self.log_prefix, selector)
             return []
     
     def random_delay(self, min_seconds=1, max_seconds=3):
@@ -142,26 +479,20 @@ class FWCTargetedScraper:
         
     def clean_url(self, url):
         """Remove query parameters like '?sid=&q=' from URLs"""
-        if not url:
-            return url
-            
-        # Split at the first question mark and keep just the base part
-        if '?' in url:
-            return url.split('?')[0]
-        return url
+        return _clean_url(url)
     
     def take_screenshot(self, name):
         """Take a screenshot and save it to the output directory"""
         filename = f"{self.output_dir}/worker_{self.worker_id}_screenshot_{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
         self.driver.save_screenshot(filename)
-        logger.debug(f"{self.log_prefix}: Screenshot saved: {filename}")
+        logger.debug("%s: Screenshot saved: %s", self.log_prefix, filename)
     
     def save_page_source(self, name):
         """Save the page source HTML for debugging"""
         filename = f"{self.output_dir}/worker_{self.worker_id}_pagesource_{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
         with open(filename, 'w', encoding='utf-8') as f:
             f.write(self.driver.page_source)
-        logger.debug(f"{self.log_prefix}: Page source saved: {filename}")
+        logger.debug("%s: Page source saved: %s", self.log_prefix, filename)
     
     def is_target_url(self, url):
         """Check if a URL is in the target URLs list (exact match)"""
@@ -170,63 +501,80 @@ class FWCTargetedScraper:
             
         # Clean the URL first (remove query parameters)
         clean_url = self.clean_url(url)
-        
-        # Return True if the URL is in the target URLs list
-        return clean_url in self.target_urls
+
+        # Bloom pre-filter: no false negatives, so a miss is a definite no;
+        # a hit still needs confirming against the exact set
+        if self.target_bloom is not None and clean_url not in self.target_bloom:
+            return False
+
+        # Return True if the URL is in the target URLs set
+        return clean_url in self.target_urls_set
     
     def create_paginated_url(self, base_url, page_num):
-        """Create a URL for a specific page number"""
-        parsed_url = urlparse(base_url)
-        query_params = parse_qs(parsed_url.query)
-        
-        # Add or update the page parameter
+        """Create a URL for a specific page number
+
+        Called once per page per worker against a fixed URL template, so the
+        page parameter is spliced in with string operations rather than a
+        full urlparse/parse_qs/urlencode/urlunparse round-trip.
+        """
+        if _RE_PAGE_NUM.search(base_url):
+            # Replace the existing page parameter in place. page=1 is kept
+            # explicit rather than stripped; the server treats it the same
+            # as no page parameter.
+            return _RE_PAGE_NUM.sub(rf'\g<1>page={page_num}', base_url, count=1)
+
         if page_num > 1:
-            query_params['page'] = [str(page_num)]
-        elif 'page' in query_params:
-            # Remove page parameter for page 1
-            del query_params['page']
-        
-        # Reconstruct the URL
-        new_query = urlencode(query_params, doseq=True)
-        paginated_url = urlunparse((
-            parsed_url.scheme,
-            parsed_url.netloc,
-            parsed_url.path,
-            parsed_url.params,
-            new_query,
-            parsed_url.fragment
-        ))
-        
-        return paginated_url
+            separator = '&' if '?' in base_url else '?'
+            return f"{base_url}{separator}page={page_num}"
+
+        # Page 1 of a template without a page parameter is the base URL itself
+        return base_url
     
-    def process_page(self, url, current_page_num=1):
-        """Process a single page of search results"""
-        # Acquire lock to check visited pages
+    def process_page(self, url, current_page_num=1, next_url=None):
+        """Process a single page of search results
+
+        When next_url is given, navigation to it is kicked off right after
+        the current page is snapshotted, so the Python-side extraction work
+        overlaps the browser's next page load instead of following it.
+        """
+        # Abort before paying for a page load if the targets are exhausted
+        if self.done_event is not None and self.done_event.is_set():
+            logger.info("%s: All target URLs have been processed. Skipping page: %s", self.log_prefix, url)
+            return None
+
+        # Check if we've already found all target URLs. There is no visited
+        # set: the pagination loops visit each page exactly once and worker
+        # page ranges are disjoint by construction.
         with self.lock:
-            # Check if we've already visited this page
-            if url in self.visited_pages:
-                logger.info(f"{self.log_prefix}: Skipping already visited page: {url}")
-                return None
-            
-            # Mark this page as visited
-            self.visited_pages.append(url)
-            
-            # Check if we've already found all target URLs
             if len(self.processed_targets) >= len(self.target_urls) and self.target_urls:
-                logger.info(f"{self.log_prefix}: All target URLs have been processed. Ending search.")
+                logger.info("%s: All target URLs have been processed. Ending search.", self.log_prefix)
                 return None
-        
-        logger.info(f"{self.log_prefix}: Processing page {current_page_num}: {url}")
+
+        logger.info("%s: Processing page %d: %s", self.log_prefix, current_page_num, url)
         
         try:
-            # Navigate to the URL
-            self.driver.get(url)
-            
-            # Take a screenshot before waiting for elements
-            self.take_screenshot(f"page-{current_page_num}")
+            # Navigate to the URL unless the previous iteration already
+            # started loading it while we were extracting
+            if self._prefetched_url == url:
+                self._prefetched_url = None
+                # The old document stays live until the navigation commits;
+                # wait for the marker set before navigating to vanish with
+                # it so we never snapshot the previous page twice
+                try:
+                    WebDriverWait(self.driver, 60).until(
+                        lambda d: d.execute_script("return window.__fwcPrefetching !== true"))
+                except TimeoutException:
+                    logger.warning("%s: Prefetched navigation stalled, reloading %s", self.log_prefix, url)
+                    self.driver.get(url)
+            else:
+                self.driver.get(url)
+
+            # Take a screenshot before waiting for elements (debug only)
+            if self.debug:
+                self.take_screenshot(f"page-{current_page_num}")
             
             # Log the page title
-            logger.info(f"{self.log_prefix}: Page title: {self.driver.title}")
+            logger.info("%s: Page title: %s", self.log_prefix, self.driver.title)
             
             # Wait for search results to load
             result_items = self.wait_for_elements('.fwc-results-item', timeout=60)
@@ -239,33 +587,45 @@ class FWCTargetedScraper:
                     search_input.send_keys("*")
                     search_button = self.driver.find_element(By.CSS_SELECTOR, ".fwc-input-search-icon")
                     search_button.click()
-                    
-                    self.random_delay(5, 8)
-                    
-                    # Try again to wait for results
+
+                    # Wait for results rather than sleeping a fixed interval;
+                    # wait_for_elements returns the moment they appear
                     result_items = self.wait_for_elements('.fwc-results-item', timeout=60)
                     if not result_items:
-                        logger.warning(f"{self.log_prefix}: Still no results after attempting search")
+                        logger.warning("%s: Still no results after attempting search", self.log_prefix)
                         return False
                 except NoSuchElementException:
-                    logger.warning(f"{self.log_prefix}: Search input not found")
+                    logger.warning("%s: Search input not found", self.log_prefix)
                     return False
             
-            logger.info(f"{self.log_prefix}: Found {len(result_items)} .fwc-results-item elements")
+            logger.info("%s: Found %d .fwc-results-item elements", self.log_prefix, len(result_items))
             
-            # Save page source for debugging PDF links
-            self.save_page_source(f"page-{current_page_num}")
-            
-            # Process result items
-            found_target_on_page = self.extract_agreements(result_items, current_page_num)
+            # Save page source for debugging PDF links (debug only)
+            if self.debug:
+                self.save_page_source(f"page-{current_page_num}")
+
+            # Snapshot all result items in one round-trip. The snapshot is
+            # plain dicts, so the browser is free afterwards: start loading
+            # the next page now and extract while it's in flight.
+            items = self.snapshot_result_items()
+            if next_url is not None and not (self.done_event is not None and self.done_event.is_set()):
+                try:
+                    self.driver.execute_script(
+                        "window.__fwcPrefetching = true; window.location.assign(arguments[0]);",
+                        next_url)
+                    self._prefetched_url = next_url
+                except Exception as e:
+                    logger.debug("%s: Could not prefetch next page: %s", self.log_prefix, e)
+
+            found_target_on_page = self.extract_agreements(items, current_page_num)
             
             # If we have targets and didn't find any on this page, log it
             if self.target_urls and not found_target_on_page:
-                logger.info(f"{self.log_prefix}: No target URLs found on this page.")
+                logger.info("%s: No target URLs found on this page.", self.log_prefix)
             
             # Check for no results (could be at the end of pagination)
             if len(result_items) == 0:
-                logger.info(f"{self.log_prefix}: No results found on this page. May have reached the end of results.")
+                logger.info("%s: No results found on this page. May have reached the end of results.", self.log_prefix)
                 return None
             
             return True
@@ -275,72 +635,76 @@ class FWCTargetedScraper:
             self.take_screenshot(f"error-page-{current_page_num}")
             return False
     
-    def extract_agreements(self, result_items, current_page_num):
-        """Extract agreement data from search results, but only for target URLs"""
-        logger.info(f"{self.log_prefix}: Extracting data from search results...")
-        
+    def snapshot_result_items(self):
+        """Snapshot all result items on the page with a single JS call
+
+        Each find_element/get_attribute call is a JSON-over-HTTP round-trip
+        to chromedriver, and the old per-item loop issued a dozen of them per
+        result. One execute_script call returns everything the extraction
+        logic needs as plain dicts.
+        """
+        return self.driver.execute_script("""
+            return [...document.querySelectorAll('.fwc-results-item')].map(item => ({
+                pdfHref: item.querySelector('a[href^="/document-search/view/"] img[alt="PDF"]')?.parentElement?.href || null,
+                downloadOnclick: item.querySelector('.fwc-button')?.getAttribute('onclick') || null,
+                title: item.querySelector('h3')?.innerText || null,
+                chips: [...item.querySelectorAll('.fwc-chip')].map(c => ({
+                    text: c.innerText,
+                    onclick: c.getAttribute('onclick') || ''
+                }))
+            }));
+        """)
+
+    def extract_agreements(self, items, current_page_num):
+        """Extract agreement data from snapshotted result items, but only for target URLs"""
+        logger.info("%s: Extracting data from search results...", self.log_prefix)
+
         found_target = False
-        
-        for item in result_items:
+        target_count = len(self.target_urls)
+
+        # Track the processed count locally so the completion checks don't
+        # pay a len() IPC round-trip on the manager proxy per item
+        with self.lock:
+            processed_count = len(self.processed_targets)
+
+        for item in items:
             try:
                 # First, extract the PDF download URL to see if this is a target
                 download_url = None
-                
-                # STEP 1: Look for the PDF link with img[alt="PDF"]
-                try:
-                    pdf_links = item.find_elements(By.CSS_SELECTOR, 'a[href^="/document-search/view/"] img[alt="PDF"]')
-                    if pdf_links:
-                        # Get the parent <a> tag of the first PDF image
-                        pdf_link = pdf_links[0].find_element(By.XPATH, '..')
-                        pdf_href = pdf_link.get_attribute('href')
-                        if pdf_href:
-                            # Combine with base URL if it's a relative URL
-                            if pdf_href.startswith('/'):
-                                full_url = urljoin(self.base_url, pdf_href)
-                            else:
-                                full_url = pdf_href
-                                
-                            # Clean the URL by removing query parameters
-                            download_url = self.clean_url(full_url)
-                except Exception as e:
-                    logger.warning(f"{self.log_prefix}: Error extracting PDF link: {e}")
-                
-                # STEP 2: If not found, try fallback method with .fwc-button
+
+                # STEP 1: Use the PDF link found next to img[alt="PDF"]
+                pdf_href = item.get('pdfHref')
+                if pdf_href:
+                    # Combine with base URL if it's a relative URL
+                    if pdf_href.startswith('/'):
+                        full_url = urljoin(self.base_url, pdf_href)
+                    else:
+                        full_url = pdf_href
+
+                    # Clean the URL by removing query parameters
+                    download_url = self.clean_url(full_url)
+
+                # STEP 2: If not found, try fallback method with the .fwc-button onclick
                 if not download_url:
-                    try:
-                        download_button = item.find_element(By.CSS_SELECTOR, '.fwc-button')
-                        onclick_attr = download_button.get_attribute('onclick')
-                        if onclick_attr:
-                            # Parse document ID from onclick attribute
-                            match = re.search(r"downloadDocument\(['\"]([\d]+)['\"],[\\s]*['\"](.*?)['\"]\\)", onclick_attr)
-                            if match and match.group(1) and match.group(2):
-                                document_id = match.group(1)
-                                document_name = match.group(2)
-                                # Create URL and clean it
-                                full_url = f"{self.base_url}/document-search/view/{document_id}/{document_name}"
-                                download_url = self.clean_url(full_url)
-                    except NoSuchElementException:
-                        pass
-                
-                # Acquire lock to check if this is a target URL and update processed targets
-                with self.lock:
-                    # Check if this URL is a target URL
-                    if not download_url or not self.is_target_url(download_url):
-                        # Skip this item if it's not a target
-                        continue
-                    
-                    # Check if we've already processed this target in another worker
-                    if download_url in self.processed_targets:
-                        logger.info(f"{self.log_prefix}: Target URL already processed by another worker: {download_url}")
-                        continue
-                    
-                    # Record that we've processed this target
-                    self.processed_targets.append(download_url)
-                    logger.info(f"{self.log_prefix}: Found target URL: {download_url}")
-                
-                # Track that we found a target
-                found_target = True
-                
+                    onclick_attr = item.get('downloadOnclick')
+                    if onclick_attr:
+                        # Parse document ID from onclick attribute
+                        match = _RE_DOWNLOAD.search(onclick_attr)
+                        if match and match.group(1) and match.group(2):
+                            document_id = match.group(1)
+                            document_name = match.group(2)
+                            # Create URL and clean it
+                            full_url = f"{self.base_url}/document-search/view/{document_id}/{document_name}"
+                            download_url = self.clean_url(full_url)
+
+                # Check if this URL is a target URL - the target set is a
+                # per-worker frozenset, so no lock is needed here
+                if not download_url or not self.is_target_url(download_url):
+                    # Skip this item if it's not a target
+                    continue
+
+                logger.info("%s: Found target URL: %s", self.log_prefix, download_url)
+
                 # Now extract all metadata since this is a target URL
                 agreement = {
                     'agreementTitle': "",     # Title
@@ -356,132 +720,141 @@ class FWCTargetedScraper:
                     'workerID': self.worker_id  # Track which worker found this
                 }
                 
-                # Extract title from h3 element
-                try:
-                    h3_element = item.find_element(By.TAG_NAME, 'h3')
-                    agreement['agreementTitle'] = h3_element.text.strip()
-                    logger.info(f"{self.log_prefix}: Found title: {agreement['agreementTitle']}")
-                    
+                # Extract title
+                if item.get('title'):
+                    agreement['agreementTitle'] = item['title'].strip()
+                    logger.info("%s: Found title: %s", self.log_prefix, agreement['agreementTitle'])
+
                     # Extract FWCA code from title if present
-                    fwca_match = re.search(r'\[\d{4}\]\s*FWCA\s*\d+', agreement['agreementTitle'])
+                    fwca_match = _RE_FWCA.search(agreement['agreementTitle'])
                     if fwca_match:
                         agreement['fwcaCode'] = fwca_match.group()
-                        logger.info(f"{self.log_prefix}: Found FWCA code from title: {agreement['fwcaCode']}")
-                except NoSuchElementException:
-                    pass
-                
-                # Extract all chip text and attributes
-                chips = item.find_elements(By.CSS_SELECTOR, '.fwc-chip')
-                
-                for chip in chips:
-                    try:
-                        text = chip.text.strip()
-                        onclick_attr = chip.get_attribute('onclick') or ""
-                        
-                        logger.debug(f"{self.log_prefix}: Processing chip: {text}")
-                        
-                        # Check for approval date with or without prefix
-                        if "Approved:" in text:
-                            agreement['approvalDate'] = text.replace('Approved:', '').strip()
-                            logger.info(f"{self.log_prefix}: Found approval date: {agreement['approvalDate']}")
-                        # Match date patterns for approval date if no specific label
-                        elif not agreement['approvalDate'] and re.match(r'^\d{1,2}\s+[A-Za-z]+\s+\d{4}$', text):
-                            agreement['approvalDate'] = text
-                            logger.info(f"{self.log_prefix}: Found date (likely approval date): {agreement['approvalDate']}")
-                        
-                        # Check for nominal expiry / expiry date
-                        if "Nominal expiry:" in text:
-                            agreement['nominalExpiry'] = text.replace('Nominal expiry:', '').strip()
-                            logger.info(f"{self.log_prefix}: Found nominal expiry: {agreement['nominalExpiry']}")
-                        
-                        # Check for agreement code (AE number)
-                        if re.match(r'^AE\d+$', text):
-                            agreement['agreementCode'] = text
-                            logger.info(f"{self.log_prefix}: Found agreement code: {agreement['agreementCode']}")
-                        
-                        # Check for FWCA code if not already found in title
-                        if not agreement['fwcaCode'] and re.match(r'^\[\d{4}\]\s*FWCA\s*\d+$', text):
-                            agreement['fwcaCode'] = text
-                            logger.info(f"{self.log_prefix}: Found FWCA code from chip: {agreement['fwcaCode']}")
-                        
-                        # Check for agreement type
-                        if text in ['Single-enterprise Agreement', 'Multi-enterprise Agreement', 'Greenfields Agreement']:
-                            agreement['agreementType'] = text
-                            logger.info(f"{self.log_prefix}: Found agreement type: {agreement['agreementType']}")
-                        
-                        # Check for industry
-                        industry_keywords = ['industry', 'Building', 'Construction', 'Metal', 'Health', 'Education', 'Mining','services']
-                        if any(keyword in text for keyword in industry_keywords):
-                            agreement['industry'] = text
-                            logger.info(f"{self.log_prefix}: Found industry: {agreement['industry']}")
-                        
-                        # Check for status
-                        status_values = ['Approved', 'Current', 'Terminated', 'Superseded']
-                        if text in status_values or "Status:" in text:
-                            # Clean up status text if it has a prefix
-                            agreement['status'] = text.replace('Status:', '').strip() if "Status:" in text else text
-                            logger.info(f"{self.log_prefix}: Found status: {agreement['status']}")
-                        
-                        # Extract filter information from onclick attribute if present
-                        if "applyTagAsFilter" in onclick_attr:
-                            filter_match = re.search(r"applyTagAsFilter\(['\"](.*?)['\"],[\\s]*['\"](.*?)['\"]\\)", onclick_attr)
-                            if filter_match:
-                                filter_type = filter_match.group(1)
-                                filter_value = filter_match.group(2)
-                                
-                                if filter_type == 'Status' and not agreement['status']:
-                                    agreement['status'] = filter_value
-                                elif filter_type == 'AgreementType' and not agreement['agreementType']:
-                                    agreement['agreementType'] = filter_value
-                                elif filter_type == 'Industry' and not agreement['industry']:
-                                    agreement['industry'] = filter_value
-                    except StaleElementReferenceException:
-                        continue
-                
-                # Add the agreement data to results
+                        logger.info("%s: Found FWCA code from title: %s", self.log_prefix, agreement['fwcaCode'])
+
+                # Process all chip text and attributes from the snapshot
+                for chip in item.get('chips', []):
+                    text = chip['text'].strip()
+                    onclick_attr = chip['onclick'] or ""
+
+                    logger.debug("%s: Processing chip: %s", self.log_prefix, text)
+
+                    # Check for approval date with or without prefix
+                    if "Approved:" in text:
+                        agreement['approvalDate'] = text.replace('Approved:', '').strip()
+                        logger.info("%s: Found approval date: %s", self.log_prefix, agreement['approvalDate'])
+                    # Match date patterns for approval date if no specific label
+                    elif not agreement['approvalDate'] and _RE_DATE.fullmatch(text):
+                        agreement['approvalDate'] = text
+                        logger.info("%s: Found date (likely approval date): %s", self.log_prefix, agreement['approvalDate'])
+
+                    # Check for nominal expiry / expiry date
+                    if "Nominal expiry:" in text:
+                        agreement['nominalExpiry'] = text.replace('Nominal expiry:', '').strip()
+                        logger.info("%s: Found nominal expiry: %s", self.log_prefix, agreement['nominalExpiry'])
+
+                    # Check for agreement code (AE number)
+                    if _RE_AE.fullmatch(text):
+                        agreement['agreementCode'] = text
+                        logger.info("%s: Found agreement code: %s", self.log_prefix, agreement['agreementCode'])
+
+                    # Check for FWCA code if not already found in title
+                    if not agreement['fwcaCode'] and _RE_FWCA.fullmatch(text):
+                        agreement['fwcaCode'] = text
+                        logger.info("%s: Found FWCA code from chip: %s", self.log_prefix, agreement['fwcaCode'])
+
+                    # Check for agreement type
+                    if text in _AGREEMENT_TYPES:
+                        agreement['agreementType'] = text
+                        logger.info("%s: Found agreement type: %s", self.log_prefix, agreement['agreementType'])
+
+                    # Check for industry (single scan over the chip text)
+                    if _has_industry_keyword(text):
+                        agreement['industry'] = text
+                        logger.info("%s: Found industry: %s", self.log_prefix, agreement['industry'])
+
+                    # Check for status
+                    if text in _STATUS_VALUES or "Status:" in text:
+                        # Clean up status text if it has a prefix
+                        agreement['status'] = text.replace('Status:', '').strip() if "Status:" in text else text
+                        logger.info("%s: Found status: %s", self.log_prefix, agreement['status'])
+
+                    # Extract filter information from onclick attribute if present
+                    if "applyTagAsFilter" in onclick_attr:
+                        filter_match = _RE_FILTER.search(onclick_attr)
+                        if filter_match:
+                            filter_type = filter_match.group(1)
+                            filter_value = filter_match.group(2)
+
+                            if filter_type == 'Status' and not agreement['status']:
+                                agreement['status'] = filter_value
+                            elif filter_type == 'AgreementType' and not agreement['agreementType']:
+                                agreement['agreementType'] = filter_value
+                            elif filter_type == 'Industry' and not agreement['industry']:
+                                agreement['industry'] = filter_value
+
+                # Single critical section per item: dedup, record the target
+                # and publish the result
                 with self.lock:
+                    if download_url in self.processed_targets:
+                        logger.info("%s: Target URL already processed: %s", self.log_prefix, download_url)
+                        continue
+
+                    self.processed_targets[download_url] = 1
                     self.results.append(agreement)
-                logger.info(f"{self.log_prefix}: Added target agreement: {agreement['agreementTitle']}")
-                
-                # Check if we've found all target URLs (with lock to avoid race condition)
-                with self.lock:
-                    if len(self.processed_targets) >= len(self.target_urls) and self.target_urls:
-                        logger.info(f"{self.log_prefix}: All target URLs have been processed. Can stop searching.")
-                        break
-                
+                    processed_count = len(self.processed_targets)
+
+                # Emit to the parent immediately in multi-worker mode
+                if self.results_queue is not None:
+                    self.results_queue.put(agreement)
+
+                # Track that we found a target
+                found_target = True
+                logger.info("%s: Added target agreement: %s", self.log_prefix, agreement['agreementTitle'])
+
+                # Check if we've found all target URLs
+                if target_count and processed_count >= target_count:
+                    logger.info("%s: All target URLs have been processed. Can stop searching.", self.log_prefix)
+                    if self.done_event is not None:
+                        self.done_event.set()
+                    break
+
             except Exception as e:
                 logger.error(f"{self.log_prefix}: Error processing result item: {e}", exc_info=True)
-        
+
         # Report results
-        with self.lock:
-            logger.info(f"{self.log_prefix}: Found {len(self.processed_targets)} out of {len(self.target_urls)} target URLs so far")
-        
+        logger.info("%s: Found %d out of %d target URLs so far", self.log_prefix, processed_count, target_count)
+
         return found_target
     
     def apply_filters(self, url):
         """Apply agreement type and status filters to the URL if specified"""
-        if not (self.agreement_type or self.status):
+        return self.build_filtered_url(url, self.agreement_type, self.status)
+
+    @staticmethod
+    def build_filtered_url(url, agreement_type=None, status=None):
+        """Build a filtered search URL - pure URL manipulation, no driver needed"""
+        if not (agreement_type or status):
             return url
-        
+
         parsed_url = urlparse(url)
         query_params = parse_qs(parsed_url.query)
-        
+
         # Add or update options parameter
         options = query_params.get('options', [''])[0]
         options_list = options.split(',') if options else []
-        
-        if self.agreement_type:
+
+        if agreement_type:
             # Remove any existing agreement type filters
             options_list = [opt for opt in options_list if not opt.startswith('AgreementType_')]
             # Add the new filter
-            options_list.append(f"AgreementType_{self.agreement_type.replace(' ', '_')}")
-        
-        if self.status:
+            options_list.append(f"AgreementType_{agreement_type.replace(' ', '_')}")
+
+        if status:
             # Remove any existing status filters
             options_list = [opt for opt in options_list if not opt.startswith('Status_')]
             # Add the new filter
-            options_list.append(f"Status_{self.status.replace(' ', '_')}")
-        
+            options_list.append(f"Status_{status.replace(' ', '_')}")
+
         # Update the options parameter
         query_params['options'] = [','.join(options_list)]
         
@@ -498,35 +871,100 @@ class FWCTargetedScraper:
         
         return filtered_url
     
-    def process_url_range(self, base_url, start_page, end_page):
-        """Process a range of pages and return found results"""
-        logger.info(f"{self.log_prefix}: Processing URL range from page {start_page} to {end_page} for {base_url}")
-        
-        for current_page in range(start_page, end_page + 1):
-            # Generate URL for current page
-            page_url = self.create_paginated_url(base_url, current_page)
-            
-            # Process the page
-            result = self.process_page(page_url, current_page)
-            
-            # Break if there was an error or we reached the end of results
-            if result is None:
-                logger.info(f"{self.log_prefix}: Stopping pagination at page {current_page}")
+    def _process_pages_http(self, base_url, page_nums):
+        """Try the HTTP fast path for a batch of pages
+
+        Returns the page numbers that still need the Selenium path, i.e.
+        those where the plain-HTTP listing contained no result items
+        (typically because the page needed JavaScript to render).
+        """
+        page_urls = {page: self.create_paginated_url(base_url, page) for page in page_nums}
+        fetched = fetch_pages_http(list(page_urls.values()))
+
+        remaining_pages = []
+        for page, url in page_urls.items():
+            items = fetched.get(url) or []
+            if not items:
+                remaining_pages.append(page)
+                continue
+
+            logger.info("%s: Processed page %d over HTTP (%d items)", self.log_prefix, page, len(items))
+            self.extract_agreements(items, page)
+
+        return remaining_pages
+
+    def process_page_queue(self, base_url, page_queue):
+        """Drain page numbers from a queue shared by all workers
+
+        Dynamic scheduling: a worker that finishes a page pulls the next
+        unclaimed one instead of sitting on a fixed slice, so uneven page
+        times never leave workers idle while stragglers keep going.
+        Returns the number of pages this worker processed.
+        """
+        pages_done = 0
+        # Pull a small batch at a time: the HTTP fast path fetches its
+        # batch concurrently, and the Selenium path needs a successor page
+        # in hand for the next-page prefetch overlap to kick in. Kept small
+        # so dynamic scheduling still balances work across workers.
+        batch_size = 5 if self.use_http_fetch else 3
+
+        while not (self.done_event is not None and self.done_event.is_set()):
+            pages = []
+            try:
+                for _ in range(batch_size):
+                    pages.append(page_queue.get_nowait())
+            except queue.Empty:
+                pass
+            if not pages:
                 break
-            
-            # Check if we've found all target URLs
-            with self.lock:
-                if len(self.processed_targets) >= len(self.target_urls) and self.target_urls:
-                    logger.info(f"{self.log_prefix}: All target URLs have been processed. Stopping search.")
+
+            # Try the cheap HTTP path for the batch first; only pages it
+            # couldn't handle go through the browser below
+            if self.use_http_fetch:
+                pages_done += len(pages)
+                pages = self._process_pages_http(base_url, pages)
+                pages_done -= len(pages)
+
+            end_of_results = False
+            for i, current_page in enumerate(pages):
+                # Generate URLs for the current page and the one after it, so
+                # process_page can overlap extraction with the next page load
+                page_url = self.create_paginated_url(base_url, current_page)
+                next_url = (self.create_paginated_url(base_url, pages[i + 1])
+                            if i + 1 < len(pages) else None)
+
+                # Process the page
+                result = self.process_page(page_url, current_page, next_url=next_url)
+                pages_done += 1
+
+                # Stop if there was an error or we reached the end of results
+                if result is None:
+                    logger.info("%s: Stopping pagination at page %d", self.log_prefix, current_page)
+                    end_of_results = True
                     break
-            
-            # Add a delay between page requests to avoid being rate-limited
-            self.random_delay(2, 4)
-        
-        # Clean up the driver when done with this range
-        self.driver.quit()
-        
-        return len(self.processed_targets)
+
+                # Check if we've found all target URLs (locally or collectively)
+                with self.lock:
+                    if len(self.processed_targets) >= len(self.target_urls) and self.target_urls:
+                        logger.info("%s: All target URLs have been processed. Stopping search.", self.log_prefix)
+                        end_of_results = True
+                        break
+                if self.done_event is not None and self.done_event.is_set():
+                    logger.info("%s: All target URLs have been processed. Stopping search.", self.log_prefix)
+                    end_of_results = True
+                    break
+
+                # Brief jitter between page navigations; the per-page wait is
+                # already driven by the results appearing, not by sleeps
+                self.random_delay(0.3, 0.8)
+
+            if end_of_results:
+                break
+
+        # Return the driver to the pool when done
+        DriverPool.release(self.driver)
+
+        return pages_done
     
     def run(self):
         """Run the scraper using URL-based pagination (single worker mode)"""
@@ -547,27 +985,30 @@ class FWCTargetedScraper:
                 
                 # Process pages until we reach max_pages or find all targets
                 while current_page <= self.max_pages:
-                    # Generate URL for current page
+                    # Generate URLs for the current page and the one after
+                    # it, so extraction overlaps the next page load
                     page_url = self.create_paginated_url(base_url, current_page)
-                    
+                    next_url = (self.create_paginated_url(base_url, current_page + 1)
+                                if current_page < self.max_pages else None)
+
                     # Process the page
-                    result = self.process_page(page_url, current_page)
+                    result = self.process_page(page_url, current_page, next_url=next_url)
                     
                     # Break if there was an error or we reached the end of results
                     if result is None:
-                        logger.info(f"{self.log_prefix}: Stopping pagination at page {current_page}")
+                        logger.info("%s: Stopping pagination at page %d", self.log_prefix, current_page)
                         break
                     
                     # Check if we've found all target URLs
                     if len(self.processed_targets) >= len(self.target_urls):
-                        logger.info(f"{self.log_prefix}: All target URLs have been processed. Stopping search.")
+                        logger.info("%s: All target URLs have been processed. Stopping search.", self.log_prefix)
                         break
                     
                     # Move to next page
                     current_page += 1
-                    
-                    # Add a delay between page requests
-                    self.random_delay(2, 4)
+
+                    # Brief jitter between page navigations
+                    self.random_delay(0.3, 0.8)
                 
                 # Check if we've found all target URLs across all start URLs
                 if len(self.processed_targets) >= len(self.target_urls):
@@ -591,321 +1032,314 @@ class FWCTargetedScraper:
         except Exception as e:
             logger.error(f"{self.log_prefix}: Error during scraping: {e}", exc_info=True)
         finally:
-            # Clean up
-            self.driver.quit()
+            # Return the driver to the pool for reuse
+            DriverPool.release(self.driver)
     
     def export_to_csv(self):
-        """Export results to CSV file"""
+        """Export results to CSV file and return the written path (or None)"""
         if not self.results:
             logger.warning(f"{self.log_prefix}: No results to export")
-            return
-        
+            return None
+
         output_file = f"{self.output_dir}/target_agreements_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        
-        headers = [
-            'Title', 
-            'Approval Date', 
-            'Expiry Date', 
-            'Agreement status', 
-            'Agreement Type',
-            'Agreement reference code', 
-            'Industry', 
-            'Citation(FWCA Code)', 
-            'Download URL',
-            'Page Number',
-            'Worker ID'  # Add worker ID for debugging
-        ]
-        
-        field_mapping = {
-            'agreementTitle': 'Title',
-            'approvalDate': 'Approval Date',
-            'nominalExpiry': 'Expiry Date',
-            'status': 'Agreement status',
-            'agreementType': 'Agreement Type',
-            'agreementCode': 'Agreement reference code',
-            'industry': 'Industry',
-            'fwcaCode': 'Citation(FWCA Code)',
-            'downloadUrl': 'Download URL',
-            'pageNumber': 'Page Number',
-            'workerID': 'Worker ID'
-        }
-        
-        try:
-            with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=headers)
-                writer.writeheader()
-                
-                for result in self.results:
-                    # Rename fields according to the mapping
-                    row = {field_mapping.get(k, k): v for k, v in result.items() if k in field_mapping}
-                    writer.writerow(row)
-            
-            logger.info(f"{self.log_prefix}: Exported {len(self.results)} records to {output_file}")
-        except Exception as e:
-            logger.error(f"{self.log_prefix}: Error exporting results to CSV: {e}", exc_info=True)
+        return _write_csv(self.results, output_file, log_prefix=self.log_prefix)
 
 
 def parse_arguments():
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(description='Fair Work Commission Targeted Agreement Scraper')
     parser.add_argument('--config', required=True, help='Path to JSON configuration file')
-    parser.add_argument('--workers', type=int, default=4, help='Number of worker processes')
+    parser.add_argument('--workers', type=int, default=4, help='Number of worker threads')
     parser.add_argument('--pages-per-worker', type=int, default=5, help='Maximum pages per worker')
     parser.add_argument('--debug', action='store_true', help='Enable debug mode (more logging)')
     return parser.parse_args()
 
 
-def worker_task(worker_id, config, base_url, page_range, shared_data):
-    """Task function for a worker process"""
+def worker_task(worker_id, page_queue, config, base_url, shared_data):
+    """Task function for a worker thread
+
+    page_queue, config, base_url and shared_data are bound once for all
+    workers via functools.partial; only worker_id varies per task.
+    """
     try:
         # Create a worker-specific scraper
         worker_scraper = FWCTargetedScraper(config, worker_id=worker_id, shared_data=shared_data)
-        
-        # Process the assigned page range
-        start_page, end_page = page_range
-        result = worker_scraper.process_url_range(base_url, start_page, end_page)
-        
-        return f"Worker {worker_id} processed pages {start_page}-{end_page}, found {result} targets"
+
+        # Pull pages from the shared queue until it drains
+        pages_done = worker_scraper.process_page_queue(base_url, page_queue)
+        found = len(worker_scraper.processed_targets)
+
+        # Hand the worker-local collections back in one transfer; the parent
+        # merges them after the future completes
+        return {
+            'summary': f"Worker {worker_id} processed {pages_done} pages, found {found} targets",
+            'results': worker_scraper.results,
+            'processed_targets': list(worker_scraper.processed_targets)
+        }
     except Exception as e:
         logger.error(f"Worker {worker_id} encountered an error: {e}", exc_info=True)
-def run_multiprocessing_scraper(config, num_workers=4, pages_per_worker=5):
+
+
+def run_parallel_scraper(config, num_workers=4, pages_per_worker=5, executor=None):
     """
-    Run the scraper with multiple workers processing different page ranges
-    
+    Run the scraper with multiple worker threads processing different page ranges
+
+    Selenium workers spend nearly all their time waiting on chromedriver
+    HTTP responses, which releases the GIL, so threads parallelize this
+    workload as well as processes did - without pickling task arguments or
+    paying cross-process queue transfers.
+
     Args:
         config: Scraper configuration dictionary
-        num_workers: Number of worker processes to use
-        pages_per_worker: Maximum number of pages each worker will process
+        num_workers: Number of worker threads to use
+        pages_per_worker: Average page budget per worker; bounds the total
+            number of pages queued for this run
+        executor: Optional ThreadPoolExecutor to reuse; one is created
+            (and shut down) locally when omitted
+
+    Returns:
+        List of agreement dicts merged from all workers
     """
     if not config.get('targetUrls', []):
         logger.warning("No target URLs provided. The scraper will not extract any agreements.")
-        return
-    
-    # Create shared data structures for workers to communicate
-    with Manager() as manager:
-        # Create shared collections for workers
-        # Note: Manager doesn't have a direct set() method, we need to use list() and manage it as a set-like structure
-        shared_data = {
-            'processed_targets': manager.list(),  # We'll use this as a set-like structure
-            'visited_pages': manager.list(),      # We'll use this as a set-like structure
-            'results': manager.list(),
-            'lock': manager.Lock()
-        }
-        
-        # Get the target page from config (default to 1)
-        target_page = config.get('targetPage', 1)
-        
-        # Calculate the total number of pages to process
-        total_pages = min(config.get('maxPages', 100), target_page + (num_workers * pages_per_worker))
-        
-        # Apply filters to start URL
-        start_url = config.get('startUrls', ['https://tribunalsearch.fwc.gov.au/document-search?q=*&options=SearchType_3%2CSortOrder_agreement-date-desc'])[0]
-        
-        # Create a temporary scraper to apply filters
-        temp_scraper = FWCTargetedScraper({**config, 'maxPages': 1})
-        filtered_url = temp_scraper.apply_filters(start_url)
-        temp_scraper.driver.quit()
-        
-        logger.info(f"Starting multiprocessing scraper with {num_workers} workers")
-        logger.info(f"Base URL: {filtered_url}")
-        logger.info(f"Starting from target page: {target_page}")
-        logger.info(f"Total pages to process: {total_pages}")
-        
-        # Create a list of page ranges for workers
-        page_ranges = []
-        
-        # Determine which pages each worker should process
-        # We'll use a staggered approach - workers handle interleaved pages to increase chances of finding targets quickly
-        for worker_id in range(num_workers):
-            # Calculate starting point for this worker based on target page
-            worker_start = target_page + worker_id
-            
-            # Create a list of pages for this worker with interleaving
-            worker_pages = [worker_start + (num_workers * i) for i in range(pages_per_worker)]
-            
-            # Filter out pages beyond the maximum
-            worker_pages = [p for p in worker_pages if p <= total_pages]
-            
-            if worker_pages:
-                page_ranges.append((worker_id, (min(worker_pages), max(worker_pages))))
-        
-        # Create a list of tasks for each worker
-        tasks = []
-        for worker_id, page_range in page_ranges:
-            tasks.append((worker_id, config, filtered_url, page_range, shared_data))
-        
-        # Use ProcessPoolExecutor to run the workers in parallel
-        logger.info(f"Launching {len(tasks)} worker tasks")
-        
-        with ProcessPoolExecutor(max_workers=num_workers) as executor:
-            futures = [executor.submit(worker_task, *task) for task in tasks]
-            
-            # Process results as they complete
-            for future in as_completed(futures):
-                try:
-                    result = future.result()
-                    logger.info(f"Worker result: {result}")
-                except Exception as e:
-                    logger.error(f"Worker encountered an exception: {e}")
-        
-        # Convert manager collections to regular Python collections
-        results = list(shared_data['results'])
-        processed_targets = list(shared_data['processed_targets'])
-        
-        # Summary of results
-        logger.info(f"Completed multiprocessing scraping. Found {len(results)} agreements out of {len(config.get('targetUrls', []))} target URLs.")
-        
-        # List of target URLs that weren't found
-        if config.get('targetUrls', []):
-            # Find missing targets - those in target_urls but not in processed_targets
-            missing_targets = [url for url in config['targetUrls'] if url not in processed_targets]
-            if missing_targets:
-                logger.warning(f"Could not find {len(missing_targets)} target URLs:")
-                for url in missing_targets:
-                    logger.warning(f" - {url}")
-        
-        # Export results to CSV if any were found
-        if results:
-            export_results_to_csv(results, config.get('targetUrls', []))
-        else:
-            logger.warning("No results to export")
+        return []
 
+    # Workers are shared-nothing: results and processed targets come back
+    # in bulk via each worker's return value. The queue and event exist only
+    # so the parent can notice mid-run that every target has been found and
+    # let in-flight workers stop before their next page load.
+    results_queue = queue.Queue()
+    done_event = Event()
+    shared_data = {
+        'results_queue': results_queue,
+        'done_event': done_event
+    }
 
-def export_results_to_csv(results, target_urls):
-    """Export results to CSV file (standalone function for multiprocessing mode)"""
-    output_dir = 'output'
-    os.makedirs(output_dir, exist_ok=True)
+    # Resolve the chromedriver path up front so worker threads don't race
+    # into the webdriver-manager update check; they share the cached global
+    get_driver_path()
     
-    output_file = f"{output_dir}/target_agreements_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+    # Get the target page from config (default to 1)
+    target_page = config.get('targetPage', 1)
     
-    headers = [
-        'Title', 
-        'Approval Date', 
-        'Expiry Date', 
-        'Agreement status', 
-        'Agreement Type',
-        'Agreement reference code', 
-        'Industry', 
-        'Citation(FWCA Code)', 
-        'Download URL',
-        'Page Number',
-        'Worker ID'  # Add worker ID for debugging
-    ]
+    # Calculate the total number of pages to process
+    total_pages = min(config.get('maxPages', 100), target_page + (num_workers * pages_per_worker))
     
-    field_mapping = {
-        'agreementTitle': 'Title',
-        'approvalDate': 'Approval Date',
-        'nominalExpiry': 'Expiry Date',
-        'status': 'Agreement status',
-        'agreementType': 'Agreement Type',
-        'agreementCode': 'Agreement reference code',
-        'industry': 'Industry',
-        'fwcaCode': 'Citation(FWCA Code)',
-        'downloadUrl': 'Download URL',
-        'pageNumber': 'Page Number',
-        'workerID': 'Worker ID'
-    }
+    # Apply filters to start URL
+    start_url = config.get('startUrls', ['https://tribunalsearch.fwc.gov.au/document-search?q=*&options=SearchType_3%2CSortOrder_agreement-date-desc'])[0]
+    
+    # Filtering is pure URL manipulation - no need to spin up a driver for it
+    filtered_url = FWCTargetedScraper.build_filtered_url(
+        start_url, config.get('agreementType'), config.get('status'))
+    
+    logger.info(f"Starting parallel scraper with {num_workers} workers")
+    logger.info(f"Base URL: {filtered_url}")
+    logger.info(f"Starting from target page: {target_page}")
+    logger.info(f"Total pages to process: {total_pages}")
     
+    # Dynamic scheduling: all pages go into one shared queue and workers
+    # pull the next unclaimed page as they finish, so a worker that lands
+    # easy pages keeps working instead of idling on a fixed slice
+    page_queue = queue.Queue()
+    for page in range(target_page, total_pages + 1):
+        page_queue.put(page)
+
+    num_tasks = min(num_workers, page_queue.qsize())
+
+    # Bind the broadcast state once; each task only varies by worker id
+    # (threads share the bound objects by reference)
+    task_fn = functools.partial(worker_task, page_queue=page_queue, config=config,
+                                base_url=filtered_url, shared_data=shared_data)
+
+    # Use ThreadPoolExecutor to run the workers in parallel
+    logger.info(f"Launching {num_tasks} worker tasks")
+
+    # The queue feeds a writer thread that streams agreements to the CSV
+    # as they are found - overlapping disk I/O with scraping and keeping
+    # the file durable mid-run - and flips done_event the moment every
+    # target URL has been seen, so remaining workers can abort early
+    target_total = len(set(config.get('targetUrls', [])))
+    output_file = f"{OUTPUT_DIR}/target_agreements_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+
+    def stream_results_to_csv():
+        seen_targets = set()
+        batch = []
+        with open(output_file, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(EXPORT_HEADERS)
+            while True:
+                try:
+                    agreement = results_queue.get(timeout=5)
+                except queue.Empty:
+                    # Flush buffered rows during lulls so the file stays
+                    # current even when results trickle in
+                    if batch:
+                        writer.writerows(batch)
+                        batch.clear()
+                        csvfile.flush()
+                    continue
+                if agreement is None:
+                    break
+                # Per-worker dedup can't catch an item that drifts across a
+                # page boundary mid-run (the listing re-sorts as agreements
+                # are published), so skip targets another worker already sent
+                if agreement['downloadUrl'] in seen_targets:
+                    continue
+                seen_targets.add(agreement['downloadUrl'])
+                batch.append([agreement.get(key, '') for key in EXPORT_KEYS])
+                if target_total and len(seen_targets) >= target_total:
+                    done_event.set()
+                if len(batch) >= _STREAM_BATCH_SIZE:
+                    writer.writerows(batch)
+                    batch.clear()
+                    csvfile.flush()
+            if batch:
+                writer.writerows(batch)
+        logger.info(f"Streamed {len(seen_targets)} results to {output_file}")
+
+    watcher = Thread(target=stream_results_to_csv, daemon=True)
+    watcher.start()
+
+    # Merge worker-local results as each future completes - one bulk
+    # transfer per worker instead of coordinating shared collections
+    results = []
+    merged_urls = set()
+    processed_targets = set()
+
+    # Reuse a caller-provided executor (retry_scraper passes one so retries
+    # don't pay thread-pool teardown/startup); otherwise own one locally
+    own_executor = executor is None
+    if own_executor:
+        executor = ThreadPoolExecutor(max_workers=num_workers)
     try:
-        with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=headers)
-            writer.writeheader()
-            
-            for result in results:
-                # Convert from manager.dict to regular dict
-                result_dict = dict(result)
-                # Rename fields according to the mapping
-                row = {field_mapping.get(k, k): v for k, v in result_dict.items() if k in field_mapping}
-                writer.writerow(row)
-        
-        logger.info(f"Exported {len(results)} records to {output_file}")
-    except Exception as e:
-        logger.error(f"Error exporting results to CSV: {e}", exc_info=True)
+        futures = [executor.submit(task_fn, worker_id)
+                   for worker_id in range(num_tasks)]
+
+        # Process results as they complete
+        for future in as_completed(futures):
+            try:
+                worker_result = future.result()
+            except Exception as e:
+                logger.error(f"Worker encountered an exception: {e}")
+                continue
+
+            if not worker_result:
+                continue
+            logger.info(f"Worker result: {worker_result['summary']}")
+            # Same cross-worker dedup as the streaming writer: drop
+            # agreements whose target another worker already returned
+            for agreement in worker_result['results']:
+                if agreement.get('downloadUrl') in merged_urls:
+                    continue
+                merged_urls.add(agreement.get('downloadUrl'))
+                results.append(agreement)
+            processed_targets.update(worker_result['processed_targets'])
+    finally:
+        if own_executor:
+            executor.shutdown(wait=True)
+
+    # Stop the streaming writer once all workers have finished; it drains
+    # anything still queued before closing the file
+    results_queue.put(None)
+    watcher.join()
+    
+    # Summary of results
+    logger.info(f"Completed parallel scraping. Found {len(results)} agreements out of {len(config.get('targetUrls', []))} target URLs.")
+    
+    # List of target URLs that weren't found
+    if config.get('targetUrls', []):
+        # Find missing targets - those in target_urls but not in processed_targets
+        missing_targets = [url for url in config['targetUrls'] if url not in processed_targets]
+        if missing_targets:
+            logger.warning(f"Could not find {len(missing_targets)} target URLs:")
+            for url in missing_targets:
+                logger.warning(f" - {url}")
+    
+    # The writer thread already streamed everything to disk; nothing left
+    # to export in one burst at the end
+    if results:
+        logger.info(f"Results written to {output_file}")
+    else:
+        logger.warning("No results to export")
+
+    return results
 
 
-def retry_scraper(config, max_retries=3):
+def retry_scraper(config, max_retries=3, num_workers=4):
     """
     Run the scraper with retries for any missing target URLs
-    
+
     Args:
         config: Scraper configuration dictionary
         max_retries: Maximum number of retry attempts
+        num_workers: Worker thread count for the shared executor
     """
     original_targets = list(config.get('targetUrls', []))
     remaining_targets = original_targets.copy()
-    
-    # First attempt with multiprocessing
-    logger.info(f"Initial scraper run - searching for {len(remaining_targets)} targets")
-    run_multiprocessing_scraper(config)
-    
-    # Check output directory for CSV files to determine which targets were found
-    output_dir = 'output'
-    csv_files = [f for f in os.listdir(output_dir) if f.endswith('.csv') and f.startswith('target_agreements_')]
-    
-    if not csv_files:
-        logger.warning("No results found from initial run. Starting retry attempts.")
-    else:
-        # Get the most recent CSV file
-        latest_csv = sorted(csv_files)[-1]
-        found_urls = []
-        
-        # Read the CSV to find which targets were found
-        try:
-            with open(os.path.join(output_dir, latest_csv), 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    if 'Download URL' in row and row['Download URL']:
-                        found_urls.append(row['Download URL'])
-            
-            # Update remaining targets - remove found URLs from the remaining targets list
+
+    # One thread pool shared by the initial run and every retry, so later
+    # attempts reuse warm threads instead of paying pool teardown/startup
+    # (drivers are likewise reused across attempts via DriverPool)
+    executor = ThreadPoolExecutor(max_workers=num_workers)
+    try:
+        # First attempt with the parallel scraper
+        logger.info(f"Initial scraper run - searching for {len(remaining_targets)} targets")
+        initial_results = run_parallel_scraper(config, num_workers=num_workers,
+                                               executor=executor)
+
+        # Work out which targets were found straight from the returned results
+        # rather than re-parsing the CSV the run just wrote
+        if not initial_results:
+            logger.warning("No results found from initial run. Starting retry attempts.")
+        else:
+            found_urls = {result['downloadUrl'] for result in initial_results if result.get('downloadUrl')}
             remaining_targets = [url for url in remaining_targets if url not in found_urls]
             logger.info(f"Found {len(found_urls)} targets in initial run. {len(remaining_targets)} targets remain.")
-        except Exception as e:
-            logger.error(f"Error reading results CSV: {e}", exc_info=True)
     
-    # Retry for any remaining targets
-    retry_count = 0
-    while remaining_targets and retry_count < max_retries:
-        retry_count += 1
-        logger.info(f"Retry attempt {retry_count}/{max_retries} - searching for {len(remaining_targets)} targets")
-        
-        # Update config with just the remaining targets
-        retry_config = config.copy()
-        retry_config['targetUrls'] = remaining_targets
-        
-        # For retries, increase the target page to search deeper
-        if 'targetPage' in config:
-            retry_config['targetPage'] = config['targetPage'] + (retry_count * 100)
-        else:
-            # If no target page was specified, start deeper into the results
-            retry_config['targetPage'] = 100 * retry_count
-        
-        # Run the scraper in single-worker mode with increased max pages for retries
-        retry_config['maxPages'] = config.get('maxPages', 100) + (retry_count * 100)
-        single_scraper = FWCTargetedScraper(retry_config)
-        single_scraper.run()
-        
-        # Check which targets were found in this retry
-        if single_scraper.results:
-            logger.info(f"Retry {retry_count} found {len(single_scraper.results)} targets")
-            found_in_retry = [result['downloadUrl'] for result in single_scraper.results]
-            
-            # Update remaining targets - remove newly found URLs from the remaining targets list
-            remaining_targets = [url for url in remaining_targets if url not in found_in_retry]
+        # Retry for any remaining targets
+        retry_count = 0
+        while remaining_targets and retry_count < max_retries:
+            retry_count += 1
+            logger.info(f"Retry attempt {retry_count}/{max_retries} - searching for {len(remaining_targets)} targets")
+        
+            # Layer the retry overrides on top of the base config instead of
+            # copying it (the targetUrls list can be large); downstream
+            # config.get(...) lookups work unchanged through the ChainMap
+            retry_config = ChainMap({
+                'targetUrls': remaining_targets,
+                # For retries, increase the target page to search deeper;
+                # if none was specified, start deeper into the results
+                'targetPage': config.get('targetPage', 0) + (retry_count * 100),
+                # Single-worker mode gets increased max pages for retries
+                'maxPages': config.get('maxPages', 100) + (retry_count * 100)
+            }, config)
+            single_scraper = FWCTargetedScraper(retry_config)
+            # Run on the shared pool so the retry reuses a warm worker thread
+            executor.submit(single_scraper.run).result()
+        
+            # Check which targets were found in this retry
+            if single_scraper.results:
+                logger.info(f"Retry {retry_count} found {len(single_scraper.results)} targets")
+                found_in_retry = {result['downloadUrl'] for result in single_scraper.results}
+
+                # Update remaining targets - remove newly found URLs from the remaining targets list
+                remaining_targets = [url for url in remaining_targets if url not in found_in_retry]
             
-            if not remaining_targets:
-                logger.info("All targets found! No further retries needed.")
-                break
-        else:
-            logger.warning(f"Retry {retry_count} found no targets")
+                if not remaining_targets:
+                    logger.info("All targets found! No further retries needed.")
+                    break
+            else:
+                logger.warning(f"Retry {retry_count} found no targets")
     
-    # Final report
-    if remaining_targets:
-        logger.warning(f"After {retry_count + 1} attempts, {len(remaining_targets)} targets still not found:")
-        for url in remaining_targets:
-            logger.warning(f" - {url}")
-    else:
-        logger.info("Successfully found all target URLs!")
+        # Final report
+        if remaining_targets:
+            logger.warning(f"After {retry_count + 1} attempts, {len(remaining_targets)} targets still not found:")
+            for url in remaining_targets:
+                logger.warning(f" - {url}")
+        else:
+            logger.info("Successfully found all target URLs!")
+    finally:
+        executor.shutdown(wait=True)
 
 
 def main():
@@ -916,16 +1350,18 @@ def main():
     if args.debug:
         logger.setLevel(logging.DEBUG)
         logger.debug("Debug mode enabled")
-    
+
     # Load configuration from file
     if not os.path.exists(args.config):
         logger.error(f"Error: Configuration file '{args.config}' not found.")
         exit(1)
         
-    with open(args.config, 'r') as config_file:
+    # Read as bytes: orjson parses bytes directly, and stdlib json accepts
+    # them too
+    with open(args.config, 'rb') as config_file:
         try:
-            config = json.load(config_file)
-        except json.JSONDecodeError as e:
+            config = _load_json(config_file.read())
+        except ValueError as e:
             logger.error(f"Error parsing configuration file: {e}")
             exit(1)
     
@@ -933,6 +1369,18 @@ def main():
     if 'targetUrls' not in config or not isinstance(config['targetUrls'], list):
         logger.warning("Warning: No target URLs provided in configuration or 'targetUrls' is not a list.")
         config['targetUrls'] = []
+    else:
+        # Dedup early (order-preserving) so duplicated entries - common
+        # when target lists are concatenated - don't inflate every
+        # membership check and missing-target diff downstream
+        unique_targets = list(dict.fromkeys(config['targetUrls']))
+        if len(unique_targets) != len(config['targetUrls']):
+            logger.info(f"Removed {len(config['targetUrls']) - len(unique_targets)} duplicate target URLs")
+        config['targetUrls'] = unique_targets
+
+    # --debug also enables per-page screenshot and page-source capture
+    if args.debug:
+        config['debug'] = True
     
     # Update max pages based on argument
     if args.pages_per_worker:
@@ -948,7 +1396,11 @@ def main():
     logger.info(f"Pages per worker: {args.pages_per_worker}")
     
     # Run the scraper with retry mechanism
-    retry_scraper(config)
+    try:
+        retry_scraper(config)
+    finally:
+        # Quit any drivers still held in the pool
+        DriverPool.shutdown()
 
 
 if __name__ == "__main__":